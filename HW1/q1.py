@@ -1,7 +1,8 @@
 import networkx as nx
-import random
+import numpy as np
+import scipy.sparse as sp
 
-def watts_strogatz_model(n, k, p):
+def watts_strogatz_model(n, k, p, seed=None):
     """
     Implement the Watts-Strogatz small-world model.
     
@@ -14,6 +15,8 @@ def watts_strogatz_model(n, k, p):
         (k/2 on each side). Must be even and k < n.
     p : float
         Probability of rewiring each edge (0 <= p <= 1)
+    seed : int, optional
+        Seed for the random number generator
     
     Returns:
     --------
@@ -33,50 +36,71 @@ def watts_strogatz_model(n, k, p):
     if not (0 <= p <= 1):
         raise ValueError("p must be between 0 and 1")
     
+    rng = np.random.default_rng(seed)
+    
     # Step 1: Create ring lattice
     G = nx.Graph()
     
     # Add all nodes
-    for i in range(n):
-        G.add_node(i)
+    G.add_nodes_from(range(n))
     
-    # Connect each node to k/2 neighbors on left and right
-    for i in range(n):
-        for j in range(1, k // 2 + 1):
-            right_neighbor = (i + j) % n
-            left_neighbor = (i - j) % n
-            G.add_edge(i, right_neighbor)
-            G.add_edge(i, left_neighbor)
+    # Connect each node to its k/2 neighbors on the right; the left-hand
+    # edges are the same edges seen from the other endpoint
+    sources = np.arange(n, dtype=np.int32).repeat(k // 2)
+    offsets = np.tile(np.arange(1, k // 2 + 1, dtype=np.int32), n)
+    targets = (sources + offsets) % n
+    ring_edges = np.stack([sources, targets], axis=1)
+    G.add_edges_from(ring_edges.tolist())
     
     # Step 2: Recreate edges with probability p
-    edges = list(G.edges())
+    # With p = 0 no edge is rewired, so the ring lattice is the result
+    if p == 0:
+        return G
+    
+    # Edges are kept as two parallel arrays (sources[e], targets[e]); pick
+    # the edges to rewire with a single vectorized Bernoulli draw
+    if p == 1:
+        # Every edge is rewired, no need to draw
+        rewire_idx = np.arange(sources.size)
+    else:
+        rewire_mask = rng.random(sources.size) < p
+        rewire_idx = np.flatnonzero(rewire_mask)
+    
+    # Keep the current neighbors of every node in a set so candidate
+    # targets are checked with a set lookup instead of G.has_edge
+    adj = {v: set(G.neighbors(v)) for v in G.nodes()}
+    
+    # Candidate targets are drawn in batches rather than one call per draw;
+    # most rewires accept their first candidate, so a 4x oversample rarely runs
+    # out, and a new batch is drawn if it does
+    batch_size = 4 * rewire_idx.size
+    candidates = []
+    next_candidate = 0
     
-    for edge in edges:
-        i = edge[0]
-        j = edge[1]
+    for i, j in zip(sources[rewire_idx].tolist(), targets[rewire_idx].tolist()):
+        neighbors_i = adj[i]
         
-        # Skip if we already processed this edge from the other direction
-        if i > j:
+        # Only rewire if we have valid targets
+        if len(neighbors_i) >= n - 1:
             continue
-            
-        # Rewire with probability p
-        if random.random() < p:
-            # Find all possible new targets
-            possible_targets = []
-            for node in range(n):
-                # Can't connect to itself
-                if node == i:
-                    continue
-                # Can't connect if already connected
-                if G.has_edge(i, node):
-                    continue
-                possible_targets.append(node)
-            
-            # Only if we have valid targets
-             if len(possible_targets) > 0:
-                new_target = random.choice(possible_targets)
-                G.remove_edge(i, j)
-                G.add_edge(i, new_target)
+        
+        # Draw random nodes until we hit one that is neither i itself nor
+        # already connected to i; the free targets are never listed
+        while True:
+            if next_candidate == len(candidates):
+                candidates = rng.integers(0, n, size=batch_size).tolist()
+                next_candidate = 0
+            new_target = candidates[next_candidate]
+            next_candidate += 1
+            if new_target != i and new_target not in neighbors_i:
+                break
+        
+        G.remove_edge(i, j)
+        G.add_edge(i, new_target)
+        adj[i].discard(j)
+        adj[j].discard(i)
+        adj[i].add(new_target)
+        adj[new_target].add(i)
     
     return G
 
@@ -99,39 +123,35 @@ def compute_clustering_coefficient(G):
     float
         Average clustering coefficient of the graph
     """
-    clustering_coefficients = []
-    
-    # Calculate clustering coefficient for each node
-    for node in G.nodes():
-        # Get all neighbors of the current node
-        neighbors = list(G.neighbors(node))
-        k = len(neighbors)
-        
-        # If node has less than 2 neighbors, clustering coefficient is 0
-        if k < 2:
-            clustering_coefficients.append(0.0)
-            continue
-        
-        # Count edges between neighbors
-        edges_between_neighbors = 0
-        for i in range(len(neighbors)):
-            for j in range(i + 1, len(neighbors)):
-                if G.has_edge(neighbors[i], neighbors[j]):
-                    edges_between_neighbors += 1
-        
-        # Calculate clustering coefficient for this node
-        # C_i = 2 * edges_between_neighbors / (k * (k - 1))
-        max_possible_edges = k * (k - 1) / 2
-        node_clustering = edges_between_neighbors / max_possible_edges
-        
-        clustering_coefficients.append(node_clustering)
-    
-    # Calculate and return average clustering coefficient
-    if len(clustering_coefficients) > 0:
-        total = 0.0
-        for cc in clustering_coefficients:
-            total += cc
-        avg_clustering = total / len(clustering_coefficients)
-        return avg_clustering
-    else:
+    if G.number_of_nodes() == 0:
         return 0.0
+    
+    # Read every node's neighbor list (as row indices, without self-loops)
+    # and its degree in a single pass over the adjacency dict
+    adj = G._adj
+    nodes = list(adj)
+    index = {node: i for i, node in enumerate(nodes)}
+    neighbors = [[index[u] for u in adj[v] if u != v] for v in nodes]
+    k = np.fromiter(map(len, neighbors), dtype=np.int64, count=len(nodes))
+    
+    # Unweighted adjacency matrix in CSR form, built straight from the lists
+    indptr = np.zeros(len(nodes) + 1, dtype=np.int64)
+    np.cumsum(k, out=indptr[1:])
+    indices = np.fromiter((u for row in neighbors for u in row), dtype=np.int64, count=indptr[-1])
+    A = sp.csr_array((np.ones(indptr[-1], dtype=np.int64), indices, indptr),
+                     shape=(len(nodes), len(nodes)))
+    
+    # (A @ A)[u, v] is the number of common neighbors of u and v; keeping
+    # only the entries where u and v are adjacent and summing each row counts
+    # every triangle through u twice. This matches the diagonal of A^3
+    # without forming the full third product.
+    common_neighbors = (A @ A).multiply(A)
+    triangles = np.asarray(common_neighbors.sum(axis=1)).ravel() / 2.0
+    
+    # C_i = 2 * triangles_i / (k_i * (k_i - 1)), and 0 for nodes with k_i < 2
+    denom = k * (k - 1)
+    clustering_coefficients = np.divide(2 * triangles, denom,
+                                        out=np.zeros(len(k)), where=denom > 0)
+    
+    # Average clustering coefficient
+    return float(clustering_coefficients.mean())
@@ -1,6 +1,26 @@
 import networkx as nx
+import numpy as np
+from collections import deque
 
 
+def graph_to_csr(graph):
+    """
+    Converts the graph into a CSR (compressed sparse row) adjacency structure.
+
+    Parameters:
+    graph (networkx.Graph): The input graph.
+
+    Returns:
+    tuple: (nodes, indptr, indices) where nodes lists the graph's nodes in row
+    order and the neighbors of nodes[i] are indices[indptr[i]:indptr[i + 1]].
+    """
+    nodes = list(graph.nodes())
+    if len(nodes) == 0:
+        # to_scipy_sparse_array rejects empty graphs
+        return nodes, np.zeros(1, dtype=np.int32), np.zeros(0, dtype=np.int32)
+    A = nx.to_scipy_sparse_array(graph, nodelist=nodes, weight=None, format='csr')
+    return nodes, A.indptr, A.indices
+
 def compute_degree_centrality(graph, normalized=True):
     """
     Computes the degree centrality for each node in the given graph.
@@ -11,17 +31,94 @@ def compute_degree_centrality(graph, normalized=True):
     Returns:
     dict: A dictionary with nodes as keys and their degree centrality as values.
     """
-    node_degree_centrality = {}
-    for node in graph.nodes():
-        # Normalize by dividing by (N-1) where N is the number of nodes in the graph
-        degree_centrality = graph.degree(node)
+    # graph.degree() counts a self-loop twice, unlike the CSR row lengths
+    if not normalized:
+        return dict(graph.degree())
+    
+    # Normalize by dividing by (N-1) where N is the number of nodes in the graph
+    scale = 1.0 / (graph.number_of_nodes() - 1)
+    return {node: degree * scale for node, degree in graph.degree()}
+
+def _brandes(indptr, indices, n):
+    """
+    Runs one BFS per source over the CSR arrays (Brandes' algorithm).
+
+    Returns:
+    tuple: (betweenness, reachable, path_length_sums) lists indexed by node row,
+    with unnormalized betweenness, the number of nodes each node reaches and
+    the sum of its distances to them.
+    """
+    # Plain lists are faster than NumPy arrays for element-wise access
+    indptr = indptr.tolist()
+    indices = indices.tolist()
+    
+    betweenness = [0.0] * n
+    reachable = [0] * n
+    path_length_sums = [0] * n
+    
+    # Brandes' algorithm: one BFS per source followed by back-propagation
+    # of dependencies, instead of enumerating every shortest path
+    for source_node in range(n):
+        # Forward pass: BFS recording the number of shortest paths (sigma)
+        # and the predecessors of each node on those paths; the distances
+        # found along the way are all closeness needs
+        order = []
+        predecessors = [[] for _ in range(n)]
+        sigma = [0] * n
+        sigma[source_node] = 1
+        dist = [-1] * n
+        dist[source_node] = 0
+        path_length_sum = 0
+        queue = deque([source_node])
+        while queue:
+            v = queue.popleft()
+            order.append(v)
+            for w in indices[indptr[v]:indptr[v + 1]]:
+                if dist[w] < 0:
+                    dist[w] = dist[v] + 1
+                    path_length_sum += dist[w]
+                    queue.append(w)
+                if dist[w] == dist[v] + 1:
+                    sigma[w] += sigma[v]
+                    predecessors[w].append(v)
+        reachable[source_node] = len(order) - 1
+        path_length_sums[source_node] = path_length_sum
+        
+        # Backward pass: accumulate dependencies in reverse BFS order
+        delta = [0.0] * n
+        for w in reversed(order):
+            for v in predecessors[w]:
+                delta[v] += (sigma[v] / sigma[w]) * (1 + delta[w])
+            if w != source_node:
+                betweenness[w] += delta[w]
+    
+    return betweenness, reachable, path_length_sums
+
+def _closeness(reachable, path_length_sum, n, normalized):
+    """
+    Computes a node's closeness from the nodes it reaches and their distance sum.
+    """
+    # Only reachable nodes contribute to the distance sum, so nodes in
+    # disconnected graphs get a finite value (Wasserman-Faust)
+    if path_length_sum > 0:
         if normalized:
-            node_degree_centrality[node] = degree_centrality / (len(graph.nodes()) - 1)
-        else:
-            node_degree_centrality[node] = degree_centrality
-    return node_degree_centrality
+            return (reachable / path_length_sum) * (reachable / (n - 1))
+        return 1 / path_length_sum
+    return 0.0
 
-def compute_betweenness_centrality(graph, normalized=True):
+def _betweenness_centrality(nodes, betweenness, normalized):
+    """
+    Maps raw Brandes betweenness values onto their nodes, normalizing if asked.
+    """
+    # Normalize the betweenness centrality values
+    n = len(nodes)
+    if normalized and n > 2:
+        scale = 1.0 / ((n - 1) * (n - 2))
+        betweenness = [value * scale for value in betweenness]
+    
+    return dict(zip(nodes, betweenness))
+
+def compute_betweenness_centrality(graph, normalized=True, csr=None):
     """
     Computes the betweenness centrality for each node in the given graph.
     
@@ -32,72 +129,90 @@ def compute_betweenness_centrality(graph, normalized=True):
     Parameters:
     graph (networkx.Graph): The input graph.
     normalized (bool): If True, normalize by dividing by (n-1)(n-2)/2.
+    csr (tuple): Optional output of graph_to_csr(graph), to reuse a conversion.
     
     Returns:
     dict: A dictionary with nodes as keys and their betweenness centrality as values.
     """
-    node_betweenness_centrality = {}
-    for node in graph.nodes():
-        node_betweenness_centrality[node] = 0.0
-    
-    # Compute betweenness considering ALL shortest paths
-    for source_node in graph.nodes():
-        for target_node in graph.nodes():
-            if source_node != target_node:
-                try:
-                    # Get ALL shortest paths from source to target
-                    all_paths = list(nx.all_shortest_paths(graph, source_node, target_node))
-                    num_paths = len(all_paths)
-                    
-                    # Count how many paths each intermediate node appears in
-                    for path in all_paths:
-                        # Count intermediate nodes (exclude source and target)
-                        for intermediate_node in path[1:-1]:
-                            # Add fractional contribution: 1 / total_number_of_shortest_paths
-                            node_betweenness_centrality[intermediate_node] += 1.0 / num_paths
-                            
-                except nx.NetworkXNoPath:
-                    # No path exists between source and target
-                    pass
-    
-    # Normalize the betweenness centrality values
-    if normalized:
-        n = len(graph.nodes())
-        if n > 2:
-            scale = 1.0 / ((n - 1) * (n - 2))
-            for node in node_betweenness_centrality:
-                node_betweenness_centrality[node] *= scale
+    if csr is None:
+        csr = graph_to_csr(graph)
+    nodes, indptr, indices = csr
     
-    return node_betweenness_centrality
+    betweenness, _, _ = _brandes(indptr, indices, len(nodes))
+    return _betweenness_centrality(nodes, betweenness, normalized)
 
-def compute_closeness_centrality(graph, normalized=True):
+def compute_closeness_centrality(graph, normalized=True, csr=None):
     """
     computes the closeness centrality for each node in the given graph.
     Parameters:
     graph (networkx.Graph): The input graph.
+    csr (tuple): Optional output of graph_to_csr(graph), to reuse a conversion.
 
     Returns: A dictionary with nodes as keys and their closeness centrality as values.
 
     """
+    if csr is None:
+        csr = graph_to_csr(graph)
+    nodes, indptr, indices = csr
+    n = len(nodes)
+    
+    # Plain lists are faster than NumPy arrays for element-wise access
+    indptr = indptr.tolist()
+    indices = indices.tolist()
+    
     node_closeness_centrality = {}
-    for node in graph.nodes():
+    for source_node in range(n):
+        # A single BFS from source_node gives its distance to every reachable node
+        dist = [-1] * n
+        dist[source_node] = 0
+        queue = deque([source_node])
+        reachable = 0
         path_length_sum = 0
-        for target_node in graph.nodes():
-            if node != target_node:
-                try:
-                    path_length = nx.shortest_path_length(graph, source=node, target=target_node)
-                    path_length_sum += path_length
-                except nx.NetworkXNoPath:
-                    # If there is no path, we can consider the distance as infinite
-                    path_length_sum += float('inf')
-            if path_length_sum > 0 and path_length_sum != float('inf'):
-                if normalized:
-                    closeness_centrality = (len(graph.nodes()) - 1) / path_length_sum
-                else:
-                    closeness_centrality = 1 / path_length_sum
-                node_closeness_centrality[node] = closeness_centrality
+        while queue:
+            v = queue.popleft()
+            for w in indices[indptr[v]:indptr[v + 1]]:
+                if dist[w] < 0:
+                    dist[w] = dist[v] + 1
+                    path_length_sum += dist[w]
+                    reachable += 1
+                    queue.append(w)
+        node_closeness_centrality[nodes[source_node]] = _closeness(reachable, path_length_sum,
+                                                                   n, normalized)
     return node_closeness_centrality
 
+def compute_all_centralities(graph, normalized=True, csr=None):
+    """
+    Computes degree, betweenness and closeness centrality in a single pass.
+
+    Brandes' BFS from every source already finds the distances closeness
+    needs, and degree comes straight from graph.degree(), so the graph is
+    traversed once instead of once per measure.
+
+    Parameters:
+    graph (networkx.Graph): The input graph.
+    normalized (bool): If True, normalize all three measures.
+    csr (tuple): Optional output of graph_to_csr(graph), to reuse a conversion.
+
+    Returns:
+    tuple: (degree, betweenness, closeness) dictionaries with nodes as keys.
+    """
+    if csr is None:
+        csr = graph_to_csr(graph)
+    nodes, indptr, indices = csr
+    n = len(nodes)
+    
+    degree_centrality = compute_degree_centrality(graph, normalized)
+    
+    betweenness, reachable, path_length_sums = _brandes(indptr, indices, n)
+    betweenness_centrality = _betweenness_centrality(nodes, betweenness, normalized)
+    
+    closeness_centrality = {
+        node: _closeness(reachable[i], path_length_sums[i], n, normalized)
+        for i, node in enumerate(nodes)
+    }
+    
+    return degree_centrality, betweenness_centrality, closeness_centrality
+
 
 # Q2B: Create Erdos-Renyi graph and compute centrality measures
 if __name__ == "__main__":
@@ -106,10 +221,8 @@ if __name__ == "__main__":
     p = 0.3
     G = nx.erdos_renyi_graph(n, p, seed=42)
     
-    # Compute centrality measures
-    degree_centrality = compute_degree_centrality(G)
-    betweenness_centrality = compute_betweenness_centrality(G)
-    closeness_centrality = compute_closeness_centrality(G)
+    # Compute centrality measures, sharing one BFS pass between them
+    degree_centrality, betweenness_centrality, closeness_centrality = compute_all_centralities(G)
     
     # Get top 3 nodes for each centrality measure
     top_3_degree = sorted(degree_centrality.items(), key=lambda x: x[1], reverse=True)[:3]
@@ -1,5 +1,7 @@
 import networkx as nx
+import numpy as np
 import matplotlib.pyplot as plt
+from collections import deque
 
 def compute_degree_centrality(graph, normalized=True):
     """
@@ -11,15 +13,12 @@ def compute_degree_centrality(graph, normalized=True):
     Returns:
     dict: A dictionary with nodes as keys and their degree centrality as values.
     """
-    node_degree_centrality = {}
-    for node in graph.nodes():
-        # Normalize by dividing by (N-1) where N is the number of nodes in the graph
-        degree_centrality = graph.degree(node)
-        if normalized:
-            node_degree_centrality[node] = degree_centrality / (len(graph.nodes()) - 1)
-        else:
-            node_degree_centrality[node] = degree_centrality
-    return node_degree_centrality
+    if not normalized:
+        return dict(graph.degree())
+    
+    # Normalize by dividing by (N-1) where N is the number of nodes in the graph
+    scale = 1.0 / (graph.number_of_nodes() - 1)
+    return {node: degree * scale for node, degree in graph.degree()}
 
 def compute_betweenness_centrality(graph, normalized=True):
     """
@@ -32,26 +31,43 @@ def compute_betweenness_centrality(graph, normalized=True):
     Returns:
     dict: A dictionary with nodes as keys and their betweenness centrality as values.
     """
-    node_betweenness_centrality = {}
-    for node in graph.nodes():
-        node_betweenness_centrality[node] = 0
+    nodes = list(graph.nodes())
+    n = len(nodes)
     
-    # Precompute all pairs shortest paths
-    all_shortest_paths = dict(nx.all_pairs_shortest_path(graph))
+    # Number nodes 0..n-1 (in graph.nodes() order) so that paths can be
+    # counted directly into an array; neighbor lists keep the graph's own
+    # order, which decides which shortest path is counted on ties
+    index = {node: i for i, node in enumerate(nodes)}
+    neighbors = [[index[w] for w in graph.adj[v]] for v in nodes]
     
-    # Count how many times each node appears on shortest paths between other nodes
-    for source_node in graph.nodes():
-        for target_node in graph.nodes():
-            if source_node != target_node:
-                try:
-                    # Get the shortest path from source to target
-                    shortest_path = all_shortest_paths[source_node][target_node]
-                    # Count intermediate nodes (exclude source and target)
-                    for intermediate_node in shortest_path[1:-1]:
-                        node_betweenness_centrality[intermediate_node] += 1
-                except KeyError:
-                    # No path exists between source and target
-                    pass
+    # Count how many times each node appears on shortest paths between other
+    # nodes, one source at a time
+    counts = np.zeros(n, dtype=np.int64)
+    for source_node in range(n):
+        # BFS from source_node, recording the node that first reached each
+        # node; following these parents back gives one shortest path per target
+        parent = [-1] * n
+        parent[source_node] = source_node
+        order = []
+        queue = deque([source_node])
+        while queue:
+            v = queue.popleft()
+            order.append(v)
+            for w in neighbors[v]:
+                if parent[w] < 0:
+                    parent[w] = v
+                    queue.append(w)
+        
+        # A node is an intermediate node on the path to every node below it
+        # in the BFS tree, so count the nodes below each node instead of
+        # walking every path; reverse BFS order visits children first
+        below = [0] * n
+        for w in reversed(order):
+            v = parent[w]
+            if w != source_node and v != source_node:
+                below[v] += below[w] + 1
+        counts += below
+    node_betweenness_centrality = dict(zip(nodes, counts.tolist()))
     
     # Normalize the betweenness centrality values
     if normalized:
@@ -72,23 +88,42 @@ def compute_closeness_centrality(graph, normalized=True):
     Returns: A dictionary with nodes as keys and their closeness centrality as values.
 
     """
+    nodes = list(graph.nodes())
+    n = len(nodes)
+    n_minus_1 = float(n - 1)
+    
+    # Number nodes 0..n-1 so the BFS can keep distances in a plain list
+    # instead of the dict nx.single_source_shortest_path_length builds
+    index = {node: i for i, node in enumerate(nodes)}
+    neighbors = [[index[w] for w in graph.adj[v]] for v in nodes]
+    
     node_closeness_centrality = {}
-    for node in graph.nodes():
+    for source_node in range(n):
+        # A single BFS from source_node gives its distance to every reachable node
+        dist = [-1] * n
+        dist[source_node] = 0
+        queue = deque([source_node])
+        reachable = 0
         path_length_sum = 0
-        for target_node in graph.nodes():
-            if node != target_node:
-                try:
-                    path_length = nx.shortest_path_length(graph, source=node, target=target_node)
-                    path_length_sum += path_length
-                except nx.NetworkXNoPath:
-                    # If there is no path, we can consider the distance as infinite
-                    path_length_sum += float('inf')
-            if path_length_sum > 0 and path_length_sum != float('inf'):
-                if normalized:
-                    closeness_centrality = (len(graph.nodes()) - 1) / path_length_sum
-                else:
-                    closeness_centrality = 1 / path_length_sum
-                node_closeness_centrality[node] = closeness_centrality
+        while queue:
+            v = queue.popleft()
+            for w in neighbors[v]:
+                if dist[w] < 0:
+                    dist[w] = dist[v] + 1
+                    path_length_sum += dist[w]
+                    reachable += 1
+                    queue.append(w)
+        
+        # Only reachable nodes contribute to the distance sum, so nodes in
+        # disconnected graphs get a finite value (Wasserman-Faust)
+        if path_length_sum > 0:
+            if normalized:
+                closeness_centrality = (reachable / path_length_sum) * (reachable / n_minus_1)
+            else:
+                closeness_centrality = 1 / path_length_sum
+        else:
+            closeness_centrality = 0.0
+        node_closeness_centrality[nodes[source_node]] = closeness_centrality
     return node_closeness_centrality
 
 # Q2B: Create Erdos-Renyi graph and compute centrality measures
@@ -118,25 +153,33 @@ fig, axes = plt.subplots(1, 3, figsize=(18, 6))
 # Use same layout for all visualizations for easier comparison
 pos = nx.spring_layout(G, seed=42)
 
+# Read each centrality into an array in nodelist order, so the node sizes
+# line up with the nodelist passed to nx.draw and scale in one NumPy operation
+nodelist = list(G.nodes())
+scale_factor = 3000
+
 # Visualization 1: Degree Centrality
 # Scale node sizes based on degree centrality (multiply by 3000 for visibility)
-node_sizes_degree = [degree_centrality[node] * 3000 for node in G.nodes()]
-nx.draw(G, pos, node_size=node_sizes_degree, with_labels=True, 
+degree_values = np.fromiter((degree_centrality[node] for node in nodelist), dtype=float, count=len(nodelist))
+node_sizes_degree = (degree_values * scale_factor).tolist()
+nx.draw(G, pos, nodelist=nodelist, node_size=node_sizes_degree, with_labels=True,
         node_color='lightblue', edge_color='gray', ax=axes[0])
 axes[0].set_title("Degree Centrality\n(Node size proportional to degree centrality)", fontsize=12)
 
 # Visualization 2: Betweenness Centrality
 # Scale node sizes based on betweenness centrality
 # Add a minimum size to make all nodes visible
-node_sizes_betweenness = [max(betweenness_centrality[node] * 3000, 100) for node in G.nodes()]
-nx.draw(G, pos, node_size=node_sizes_betweenness, with_labels=True,
+betweenness_values = np.fromiter((betweenness_centrality[node] for node in nodelist), dtype=float, count=len(nodelist))
+node_sizes_betweenness = np.maximum(betweenness_values * scale_factor, 100).tolist()
+nx.draw(G, pos, nodelist=nodelist, node_size=node_sizes_betweenness, with_labels=True,
         node_color='lightgreen', edge_color='gray', ax=axes[1])
 axes[1].set_title("Betweenness Centrality\n(Node size proportional to betweenness centrality)", fontsize=12)
 
 # Visualization 3: Closeness Centrality
 # Scale node sizes based on closeness centrality
-node_sizes_closeness = [closeness_centrality.get(node, 0.01) * 3000 for node in G.nodes()]
-nx.draw(G, pos, node_size=node_sizes_closeness, with_labels=True,
+closeness_values = np.fromiter((closeness_centrality[node] for node in nodelist), dtype=float, count=len(nodelist))
+node_sizes_closeness = (closeness_values * scale_factor).tolist()
+nx.draw(G, pos, nodelist=nodelist, node_size=node_sizes_closeness, with_labels=True,
         node_color='lightcoral', edge_color='gray', ax=axes[2])
 axes[2].set_title("Closeness Centrality\n(Node size proportional to closeness centrality)", fontsize=12)
 